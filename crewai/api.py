@@ -1,5 +1,7 @@
 # api.py - REST API interface for CrewAI research
 
+import asyncio
+
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 from research import run_research
@@ -10,6 +12,9 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Cap on concurrent research runs per worker, to stay clear of LLM rate limits
+_RESEARCH_SLOTS = asyncio.Semaphore(16)
+
 
 class ResearchRequest(BaseModel):
     topic: str
@@ -52,7 +57,9 @@ async def research_topic(request: ResearchRequest):
         if not request.topic or not request.topic.strip():
             raise HTTPException(status_code=400, detail="Topic cannot be empty")
 
-        result = run_research(request.topic)
+        # Run the blocking research off the event loop so other requests are served meanwhile
+        async with _RESEARCH_SLOTS:
+            result = await asyncio.to_thread(run_research, request.topic)
 
         return ResearchResponse(
             topic=request.topic,
@@ -1,16 +1,30 @@
 # main.py - CLI interface for CrewAI research
 
-from research import run_research
+import argparse
+import asyncio
+
+from research import run_research, run_crew_research_async
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CrewAI research demo")
+    parser.add_argument(
+        "--crew",
+        action="store_true",
+        help="run the full CrewAI agent crew instead of the direct two-call pipeline"
+    )
+    args = parser.parse_args()
+
     # Ask user for topic
     topic = input("Enter the topic you'd like to research: ")
 
     print(f"\n🔍 Researching and writing about: {topic}")
     print("=" * 60)
 
-    result = run_research(topic)
+    if args.crew:
+        result = asyncio.run(run_crew_research_async(topic))
+    else:
+        result = run_research(topic)
 
     # Format output as a blog post
     print("\n" + "=" * 60)
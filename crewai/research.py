@@ -1,12 +1,83 @@
 # research.py - Shared CrewAI research logic
 
+import os
+from functools import lru_cache
+
+import httpx
 from crewai import Agent, Task, Crew, Process
 from crewai_tools import SerperDevTool
+from openai import OpenAI
+
+_SERPER_SEARCH_URL = "https://google.serper.dev/search"
+_MODEL = "gpt-4o-mini"
+
+_RESEARCH_PROMPT = """Research the latest developments in {topic} using the search results below.
+Focus on:
+- Key innovations in the last 6 months
+- Major players and their contributions
+- Emerging trends
+
+Search results:
+{search_results}
+
+Provide a detailed bullet-point summary."""
+
+_WRITING_PROMPT = """Using the research below, write a 3-paragraph
+article about {topic} that:
+- Starts with an engaging hook
+- Explains key developments clearly
+- Ends with future implications
+
+Target audience: Technical professionals.
+
+Research:
+{research}"""
+
+
+@lru_cache(maxsize=1)
+def _openai_client() -> OpenAI:
+    """Shared OpenAI client, created on first use"""
+    return OpenAI()
+
+
+def _serper_search(query: str) -> str:
+    """Search Google through Serper and format the organic results"""
+    response = httpx.post(
+        _SERPER_SEARCH_URL,
+        headers={"X-API-KEY": os.getenv("SERPER_API_KEY", "")},
+        json={"q": query},
+        timeout=30
+    )
+    response.raise_for_status()
+
+    return "\n---\n".join(
+        f"Title: {r.get('title', 'N/A')}\n"
+        f"Link: {r.get('link', 'N/A')}\n"
+        f"Snippet: {r.get('snippet', 'N/A')}\n"
+        for r in response.json().get("organic", [])
+    )
+
+
+def _complete(system: str, prompt: str, temperature: float) -> str:
+    """Single chat completion"""
+    response = _openai_client().chat.completions.create(
+        model=_MODEL,
+        temperature=temperature,
+        messages=[
+            {"role": "system", "content": system},
+            {"role": "user", "content": prompt}
+        ]
+    )
+    return response.choices[0].message.content
 
 
 def run_research(topic: str) -> str:
     """
-    Run research on a given topic using CrewAI agents
+    Run research on a given topic with two direct LLM calls
+
+    The topic is searched once, then one call summarizes the results and a
+    second writes the article. This is the same research -> write flow as
+    run_crew_research without the agent framework's prompt overhead.
 
     Args:
         topic: The topic to research and write about
@@ -14,6 +85,21 @@ def run_research(topic: str) -> str:
     Returns:
         str: The generated article
     """
+    research = _complete(
+        "You're a seasoned research analyst who uncovers the latest trends and data.",
+        _RESEARCH_PROMPT.format(topic=topic, search_results=_serper_search(topic)),
+        temperature=0
+    )
+
+    return _complete(
+        "You're a skilled tech writer who makes complex topics engaging.",
+        _WRITING_PROMPT.format(topic=topic, research=research),
+        temperature=0.7
+    )
+
+
+def _build_crew() -> Crew:
+    """Build the researcher -> writer crew; the topic is supplied at kickoff"""
     # Initialize tools
     search_tool = SerperDevTool()
 
@@ -63,16 +149,47 @@ def run_research(topic: str) -> str:
 
         Target audience: Technical professionals.""",
         expected_output='A 3-paragraph article',
-        agent=writer
+        agent=writer,
+        # Writing needs the finished research, so the two tasks cannot overlap
+        context=[research_task]
     )
 
-    # Create and run crew
-    crew = Crew(
+    # Create crew
+    return Crew(
         agents=[researcher, writer],
         tasks=[research_task, writing_task],
         process=Process.sequential,
         verbose=False
     )
 
-    result = crew.kickoff(inputs={'topic': topic})
+
+def run_crew_research(topic: str) -> str:
+    """
+    Run research on a given topic using CrewAI agents
+
+    Args:
+        topic: The topic to research and write about
+
+    Returns:
+        str: The generated article
+    """
+    result = _build_crew().kickoff(inputs={'topic': topic})
+    return str(result)
+
+
+async def run_crew_research_async(topic: str) -> str:
+    """
+    Run research on a given topic using CrewAI agents, without blocking the
+    event loop
+
+    Several topics can be researched concurrently with asyncio.gather, each
+    on its own crew.
+
+    Args:
+        topic: The topic to research and write about
+
+    Returns:
+        str: The generated article
+    """
+    result = await _build_crew().kickoff_async(inputs={'topic': topic})
     return str(result)
@@ -1,31 +1,43 @@
-# api.py - REST API interface for LangGraph research (5-node pipeline)
+# api.py - REST API interface for LangGraph research (4-node pipeline)
+
+import asyncio
+import hashlib
+import json
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
+from jinja2 import Environment
+from markupsafe import Markup, escape
 from pydantic import BaseModel
-from research import run_research
+from research import close_http_client, run_research, stream_research
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release the pooled OpenAI/Tavily connections
+    close_http_client()
+
 
 app = FastAPI(
     title="LangGraph Research API",
-    description="Generate research articles using 5-node LangGraph pipeline with fact-checking",
-    version="2.0.0"
+    description="Generate research articles using 4-node LangGraph pipeline with fact-checking",
+    version="2.0.0",
+    lifespan=lifespan
 )
 
 
-class ResearchRequest(BaseModel):
-    topic: str
-
+def _nl2br(text: str) -> Markup:
+    """Escape text and convert its newlines to HTML breaks."""
+    return Markup("<br>").join(escape(line) for line in text.split("\n"))
 
-class ResearchResponse(BaseModel):
-    topic: str
-    article: str
-    fact_check_result: str
 
+_JINJA = Environment(autoescape=True)
+_JINJA.filters["nl2br"] = _nl2br
 
-@app.get("/", response_class=HTMLResponse)
-async def home():
-    """Home page with input form for demo"""
-    html = """
+# Static home page, encoded once so it is served without per-request work
+_HOME_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -50,15 +62,15 @@ async def home():
 
             .results { display: none; margin-top: 30px; }
             h2 { color: #555; margin-top: 25px; }
-            .article { background: #f8f9fa; padding: 20px; border-radius: 8px; line-height: 1.6; }
-            .fact-check { background: #fff3cd; padding: 20px; border-radius: 8px; border-left: 4px solid #ffc107; line-height: 1.6; }
+            .article { background: #f8f9fa; padding: 20px; border-radius: 8px; line-height: 1.6; white-space: pre-wrap; }
+            .fact-check { background: #fff3cd; padding: 20px; border-radius: 8px; border-left: 4px solid #ffc107; line-height: 1.6; white-space: pre-wrap; }
             .new-search { margin-top: 30px; padding-top: 20px; border-top: 1px solid #eee; }
         </style>
     </head>
     <body>
         <h1>LangGraph Research Agent</h1>
         <div class="pipeline">
-            <strong>Pipeline:</strong> query_planner → researcher → fact_extractor → writer → fact_checker
+            <strong>Pipeline:</strong> query_planner + speculative_search → research_and_write → fact_checker
         </div>
 
         <div class="input-section">
@@ -70,7 +82,7 @@ async def home():
         <div class="loading" id="loading">
             <div class="spinner"></div>
             <div class="loading-text">Researching...</div>
-            <div class="step" id="step">Running pipeline: query_planner → researcher → fact_extractor → writer → fact_checker</div>
+            <div class="step" id="step">Running pipeline: query_planner + speculative_search → research_and_write → fact_checker</div>
         </div>
 
         <div class="results" id="results">
@@ -86,15 +98,29 @@ async def home():
         </div>
 
         <script>
-            const steps = [
-                "Step 1/5: Planning search queries...",
-                "Step 2/5: Executing web searches...",
-                "Step 3/5: Extracting facts...",
-                "Step 4/5: Writing article...",
-                "Step 5/5: Fact checking..."
-            ];
-            let stepIndex = 0;
-            let stepInterval;
+            const steps = {
+                query_planner: "Planning search queries and searching the topic...",
+                speculative_search: "Planning search queries and searching the topic...",
+                research_and_write: "Searching, extracting facts and writing article...",
+                fact_checker: "Fact checking..."
+            };
+
+            function handleEvent(event) {
+                if (event.type === 'node_start') {
+                    document.getElementById('step').textContent = steps[event.node] || event.node;
+                } else if (event.type === 'article') {
+                    document.getElementById('article').textContent = event.article;
+                    document.getElementById('results').style.display = 'block';
+                } else if (event.type === 'token' && event.node === 'fact_checker') {
+                    document.getElementById('factcheck').textContent += event.token;
+                } else if (event.type === 'result') {
+                    document.getElementById('article').textContent = event.article;
+                    document.getElementById('factcheck').textContent = event.fact_check_result;
+                    document.getElementById('results').style.display = 'block';
+                } else if (event.type === 'error') {
+                    throw new Error(event.detail);
+                }
+            }
 
             async function doResearch() {
                 const topic = document.getElementById('topic').value.trim();
@@ -103,34 +129,39 @@ async def home():
                 // Show loading
                 document.getElementById('loading').style.display = 'block';
                 document.getElementById('results').style.display = 'none';
+                document.getElementById('article').textContent = '';
+                document.getElementById('factcheck').textContent = '';
                 document.getElementById('submit').disabled = true;
 
-                // Animate steps
-                stepIndex = 0;
-                document.getElementById('step').textContent = steps[0];
-                stepInterval = setInterval(() => {
-                    if (stepIndex < steps.length - 1) {
-                        stepIndex++;
-                        document.getElementById('step').textContent = steps[stepIndex];
-                    }
-                }, 3000);
-
                 try {
-                    const response = await fetch('/research', {
+                    // EventSource only supports GET, so read the SSE stream from a POST by hand
+                    const response = await fetch('/research/stream', {
                         method: 'POST',
                         headers: { 'Content-Type': 'application/json' },
                         body: JSON.stringify({ topic: topic })
                     });
-                    const data = await response.json();
+                    if (!response.ok) {
+                        throw new Error((await response.json()).detail);
+                    }
 
-                    // Show results
-                    document.getElementById('article').innerHTML = data.article.replace(/\\n/g, '<br>');
-                    document.getElementById('factcheck').innerHTML = data.fact_check_result.replace(/\\n/g, '<br>');
-                    document.getElementById('results').style.display = 'block';
+                    const reader = response.body.getReader();
+                    const decoder = new TextDecoder();
+                    let buffer = '';
+                    while (true) {
+                        const { done, value } = await reader.read();
+                        if (done) break;
+                        buffer += decoder.decode(value, { stream: true });
+                        const frames = buffer.split('\\n\\n');
+                        buffer = frames.pop();
+                        for (const frame of frames) {
+                            if (frame.startsWith('data: ')) {
+                                handleEvent(JSON.parse(frame.slice(6)));
+                            }
+                        }
+                    }
                 } catch (error) {
                     alert('Error: ' + error.message);
                 } finally {
-                    clearInterval(stepInterval);
                     document.getElementById('loading').style.display = 'none';
                     document.getElementById('submit').disabled = false;
                 }
@@ -149,8 +180,95 @@ async def home():
         </script>
     </body>
     </html>
+    """.encode()
+
+# /view results page, compiled once; topic and LLM output are auto-escaped
+_VIEW_TEMPLATE = _JINJA.from_string("""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Research: {{ topic }}</title>
+            <style>
+                body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; max-width: 800px; margin: 40px auto; padding: 20px; line-height: 1.6; }
+                h1 { color: #333; border-bottom: 2px solid #007bff; padding-bottom: 10px; }
+                h2 { color: #555; margin-top: 30px; }
+                .article { background: #f8f9fa; padding: 20px; border-radius: 8px; }
+                .fact-check { background: #fff3cd; padding: 20px; border-radius: 8px; border-left: 4px solid #ffc107; }
+                .pipeline { color: #666; font-size: 14px; margin-bottom: 20px; }
+            </style>
+        </head>
+        <body>
+            <h1>Research: {{ topic }}</h1>
+            <p class="pipeline">Pipeline: query_planner + speculative_search → research_and_write → fact_checker</p>
+
+            <h2>Generated Article</h2>
+            <div class="article">{{ article|nl2br }}</div>
+
+            <h2>Fact Check Results</h2>
+            <div class="fact-check">{{ fact_check_result|nl2br }}</div>
+        </body>
+        </html>
+        """)
+
+
+# Pipeline runs in progress, keyed by normalized topic hash
+_INFLIGHT: dict[str, asyncio.Task] = {}
+
+# Cap on concurrent pipeline runs per worker, to stay clear of LLM rate limits
+_RESEARCH_SLOTS = asyncio.Semaphore(16)
+
+
+async def _run_research_slotted(topic: str) -> dict:
+    """Run the pipeline in a worker thread, off the event loop, once a run slot is free."""
+    async with _RESEARCH_SLOTS:
+        return await asyncio.to_thread(run_research, topic)
+
+
+def _finish_inflight(key: str, task: asyncio.Task):
+    """Drop a finished run from _INFLIGHT."""
+    del _INFLIGHT[key]
+    # Mark exceptions as retrieved so a failure nobody awaited isn't logged
+    if not task.cancelled():
+        task.exception()
+
+
+async def _run_research_shared(topic: str) -> dict:
+    """
+    Run research for a topic, sharing one pipeline run between concurrent
+    requests for the same topic.
+
+    The first request starts the run as a task of its own; it and any
+    request that arrives while the run is in flight await its result
+    instead of starting their own run. A cancelled request (e.g. a client
+    disconnect) stops waiting without cancelling the run, so the other
+    requests still get the result. The worker thread could not be
+    interrupted anyway.
     """
-    return HTMLResponse(content=html)
+    key = hashlib.sha256(topic.strip().lower().encode()).hexdigest()
+
+    # No await between lookup and insert, so this is atomic on the event loop
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = _INFLIGHT[key] = asyncio.create_task(_run_research_slotted(topic))
+        task.add_done_callback(lambda t: _finish_inflight(key, t))
+
+    return await asyncio.shield(task)
+
+
+class ResearchRequest(BaseModel):
+    topic: str
+
+
+class ResearchResponse(BaseModel):
+    topic: str
+    article: str
+    fact_check_result: str
+
+
+@app.get("/", response_class=HTMLResponse)
+async def home():
+    """Home page with input form for demo"""
+    return HTMLResponse(content=_HOME_HTML)
 
 
 @app.get("/api")
@@ -159,10 +277,11 @@ async def api_info():
     return {
         "name": "LangGraph Research API",
         "version": "2.0.0",
-        "pipeline": "query_planner → researcher → fact_extractor → writer → fact_checker",
+        "pipeline": "query_planner + speculative_search → research_and_write → fact_checker",
         "endpoints": {
             "GET /": "Home page with input form",
             "POST /research": "Research topic (JSON response)",
+            "POST /research/stream": "Research topic (server-sent events with live progress)",
             "GET /view?topic=": "Research topic (HTML response)",
             "GET /health": "Health check"
         }
@@ -172,7 +291,7 @@ async def api_info():
 @app.post("/research", response_model=ResearchResponse)
 async def research_topic(request: ResearchRequest):
     """
-    Research a topic using 5-node pipeline: query_planner → researcher → fact_extractor → writer → fact_checker
+    Research a topic using 4-node pipeline: query_planner + speculative_search → research_and_write → fact_checker
 
     Args:
         request: ResearchRequest containing the topic to research
@@ -188,7 +307,7 @@ async def research_topic(request: ResearchRequest):
         if not request.topic or not request.topic.strip():
             raise HTTPException(status_code=400, detail="Topic cannot be empty")
 
-        result = run_research(request.topic)
+        result = await _run_research_shared(request.topic)
 
         return ResearchResponse(
             topic=request.topic,
@@ -209,6 +328,38 @@ async def research_topic(request: ResearchRequest):
         )
 
 
+@app.post("/research/stream")
+async def research_topic_stream(request: ResearchRequest):
+    """
+    Research a topic, streaming progress as server-sent events.
+
+    Each frame is `data: {json}` with a `type` of node_start, token, article,
+    result or error; see research.stream_research for the event shapes.
+
+    Example:
+        POST /research/stream
+        {"topic": "quantum computing"}
+    """
+    if not request.topic or not request.topic.strip():
+        raise HTTPException(status_code=400, detail="Topic cannot be empty")
+
+    try:
+        events = stream_research(request.topic)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def event_generator():
+        try:
+            async with _RESEARCH_SLOTS:
+                async for event in events:
+                    yield f"data: {json.dumps(event)}\n\n"
+        except Exception as e:
+            error = {"type": "error", "detail": f"Error processing request: {str(e)}"}
+            yield f"data: {json.dumps(error)}\n\n"
+
+    return StreamingResponse(event_generator(), media_type="text/event-stream")
+
+
 @app.get("/view", response_class=HTMLResponse)
 async def research_view(topic: str):
     """
@@ -220,38 +371,13 @@ async def research_view(topic: str):
         if not topic or not topic.strip():
             raise HTTPException(status_code=400, detail="Topic cannot be empty")
 
-        result = run_research(topic)
+        result = await _run_research_shared(topic)
 
-        # Convert newlines to HTML breaks
-        article_html = result["article"].replace("\n", "<br>")
-        fact_check_html = result["fact_check_result"].replace("\n", "<br>")
-
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Research: {topic}</title>
-            <style>
-                body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; max-width: 800px; margin: 40px auto; padding: 20px; line-height: 1.6; }}
-                h1 {{ color: #333; border-bottom: 2px solid #007bff; padding-bottom: 10px; }}
-                h2 {{ color: #555; margin-top: 30px; }}
-                .article {{ background: #f8f9fa; padding: 20px; border-radius: 8px; }}
-                .fact-check {{ background: #fff3cd; padding: 20px; border-radius: 8px; border-left: 4px solid #ffc107; }}
-                .pipeline {{ color: #666; font-size: 14px; margin-bottom: 20px; }}
-            </style>
-        </head>
-        <body>
-            <h1>Research: {topic}</h1>
-            <p class="pipeline">Pipeline: query_planner → researcher → fact_extractor → writer → fact_checker</p>
-
-            <h2>Generated Article</h2>
-            <div class="article">{article_html}</div>
-
-            <h2>Fact Check Results</h2>
-            <div class="fact-check">{fact_check_html}</div>
-        </body>
-        </html>
-        """
+        html = _VIEW_TEMPLATE.render(
+            topic=topic,
+            article=result["article"],
+            fact_check_result=result["fact_check_result"]
+        )
         return HTMLResponse(content=html)
 
     except HTTPException:
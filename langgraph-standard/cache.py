@@ -0,0 +1,243 @@
+# cache.py - Semantic response cache for deterministic pipeline steps
+
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Optional, Protocol, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+
+class CacheBackend(Protocol):
+    """Key/value store holding cached responses"""
+
+    def get(self, key: str) -> Optional[str]:
+        ...
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        ...
+
+
+class InMemoryBackend:
+    """Process-local backend for development"""
+
+    def __init__(self):
+        self._data: dict[str, tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+
+
+class RedisBackend:
+    """Redis backend for production, shared between workers"""
+
+    def __init__(self, url: str):
+        import redis
+
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+
+    def get(self, key: str) -> Optional[str]:
+        return self._client.get(key)
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        self._client.set(key, value, ex=ttl)
+
+
+def make_key(namespace: str, payload: dict) -> str:
+    """Stable exact-match key for a request payload."""
+    digest = hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+    return f"research-cache:{namespace}:{digest}"
+
+
+class _EmbeddingIndex:
+    """
+    Embeddings of one namespace's prompts, oldest first, with per-row expiry.
+
+    Rows live in a preallocated buffer that doubles when full, so adding a
+    row doesn't copy the whole matrix. Every row gets the same TTL, so
+    expired rows are always a prefix and are dropped from the front.
+    """
+
+    def __init__(self, dim: int):
+        self._vectors = np.empty((16, dim), dtype=np.float32)
+        self._expires_at = np.empty(16)
+        self._keys: list[str] = []
+        self._start = 0  # rows before this are expired or evicted
+
+    def _prune(self, now: float, max_rows: int) -> None:
+        end = len(self._keys)
+        start = self._start + int(np.searchsorted(self._expires_at[self._start:end], now, side="right"))
+        self._start = max(start, end - max_rows)
+
+        # Reclaim the dropped prefix once it is at least half the buffer
+        if self._start and self._start * 2 >= end:
+            live = end - self._start
+            self._vectors[:live] = self._vectors[self._start:end]
+            self._expires_at[:live] = self._expires_at[self._start:end]
+            self._keys = self._keys[self._start:]
+            self._start = 0
+
+    def add(self, vector: np.ndarray, key: str, expires_at: float, max_rows: int) -> None:
+        self._prune(time.monotonic(), max_rows - 1)
+        row = len(self._keys)
+        if row == len(self._vectors):
+            self._vectors = np.resize(self._vectors, (row * 2, self._vectors.shape[1]))
+            self._expires_at = np.resize(self._expires_at, row * 2)
+        self._vectors[row] = vector
+        self._expires_at[row] = expires_at
+        self._keys.append(key)
+
+    def nearest(self, vector: np.ndarray, threshold: float, max_rows: int) -> Optional[str]:
+        self._prune(time.monotonic(), max_rows)
+        end = len(self._keys)
+        if self._start == end:
+            return None
+        scores = self._vectors[self._start:end] @ vector
+        best = int(np.argmax(scores))
+        if scores[best] < threshold:
+            return None
+        return self._keys[self._start + best]
+
+
+class SemanticLLMCache:
+    """
+    Response cache that matches on exact payload first, then on prompt
+    embedding similarity.
+
+    Exact keys are checked without calling the embedding model. On an exact
+    miss the prompt text is embedded and compared (cosine) against earlier
+    prompts in the same namespace; a match above the threshold returns the
+    stored response for that prompt.
+
+    The similarity index is held per process, even when the backend is
+    shared (Redis): other workers' responses are only found by exact key.
+    Index rows expire with the backend TTL, and each namespace keeps at
+    most max_index_rows of them, evicting the oldest first.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        embed: Callable[[str], list[float]],
+        threshold: float = 0.92,
+        ttl: int = 3600,
+        max_index_rows: int = 10_000,
+    ):
+        self._backend = backend
+        self._embed = embed
+        self._threshold = threshold
+        self._ttl = ttl
+        self._max_index_rows = max_index_rows
+        self._lock = threading.Lock()
+        # namespace -> L2-normalized embeddings of its cached prompts
+        self._index: dict[str, _EmbeddingIndex] = {}
+
+    def _nearest(self, namespace: str, vector: np.ndarray) -> Optional[str]:
+        with self._lock:
+            index = self._index.get(namespace)
+            if index is None:
+                return None
+            return index.nearest(vector, self._threshold, self._max_index_rows)
+
+    def _add(self, namespace: str, vector: np.ndarray, key: str) -> None:
+        with self._lock:
+            index = self._index.get(namespace)
+            if index is None:
+                index = self._index[namespace] = _EmbeddingIndex(vector.size)
+            index.add(vector, key, time.monotonic() + self._ttl, self._max_index_rows)
+
+    def cached(
+        self,
+        namespace: str,
+        payload: dict,
+        text: str,
+        compute: Callable[[], str],
+        semantic: bool = True,
+    ) -> str:
+        """
+        Return the cached response for a request, computing and storing it on a miss.
+
+        Args:
+            namespace: Cache partition, e.g. the node name
+            payload: Everything that determines the response (model, messages, ...)
+            text: Prompt text used for the similarity lookup
+            compute: Produces the response on a miss
+            semantic: Whether near-duplicate prompts may share a response
+
+        Returns:
+            str: The cached or freshly computed response
+        """
+        key = make_key(namespace, payload)
+        hit = self._backend.get(key)
+        if hit is not None:
+            return hit
+
+        vector = None
+        if semantic:
+            vector = np.asarray(self._embed(text), dtype=np.float32)
+            vector /= np.linalg.norm(vector) or 1.0
+            similar_key = self._nearest(namespace, vector)
+            if similar_key is not None:
+                hit = self._backend.get(similar_key)
+                if hit is not None:
+                    return hit
+
+        value = compute()
+        self._backend.set(key, value, self._ttl)
+        if vector is not None:
+            self._add(namespace, vector, key)
+        return value
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls so only one of them does the work.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for and share its result (or exception). Nothing is
+    retained once the call finishes - that is the response cache's job.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[str, Future] = {}
+
+    def run(self, key: str, fn: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._calls.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._calls[key] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
@@ -1,11 +1,57 @@
 #!/usr/bin/env python3
-# main.py - CLI entry point for LangGraph research (5-node pipeline)
+# main.py - CLI entry point for LangGraph research (4-node pipeline)
 
-from research import run_research
+import argparse
+
+from research import run_research, run_research_batch
+
+
+def print_result(result: dict):
+    # Display article
+    print("\n" + "=" * 50)
+    print("GENERATED ARTICLE:")
+    print("=" * 50)
+    print(result["article"])
+
+    # Display fact check results
+    print("\n" + "=" * 50)
+    print("FACT CHECK RESULTS:")
+    print("=" * 50)
+    print(result["fact_check_result"])
+    print("=" * 50)
+
+
+def run_batch(path: str):
+    # One topic per line, blank lines ignored
+    with open(path) as f:
+        topics = [line.strip() for line in f if line.strip()]
+
+    if not topics:
+        print("Error: No topics found in", path)
+        return
+
+    print(f"Submitting {len(topics)} topics to the OpenAI Batch API")
+    print("This can take a long time (up to 24h per stage)...\n")
+
+    for topic, result in zip(topics, run_research_batch(topics)):
+        print(f"\n### {topic}")
+        print_result(result)
 
 
 def main():
-    print("=== LangGraph Research Demo (5-Node Pipeline) ===\n")
+    parser = argparse.ArgumentParser(description="LangGraph research demo")
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="research every topic in FILE (one per line) via the OpenAI Batch API"
+    )
+    args = parser.parse_args()
+
+    print("=== LangGraph Research Demo (4-Node Pipeline) ===\n")
+
+    if args.batch:
+        run_batch(args.batch)
+        return
 
     # Get topic from user
     topic = input("Enter a topic to research: ").strip()
@@ -15,24 +61,12 @@ def main():
         return
 
     print(f"\nResearching: {topic}")
-    print("Pipeline: query_planner → researcher → fact_extractor → writer → fact_checker")
+    print("Pipeline: query_planner + speculative_search → research_and_write → fact_checker")
     print("This may take a minute...\n")
 
     # Run research
     result = run_research(topic)
-
-    # Display article
-    print("\n" + "=" * 50)
-    print("GENERATED ARTICLE:")
-    print("=" * 50)
-    print(result["article"])
-
-    # Display fact check results
-    print("\n" + "=" * 50)
-    print("FACT CHECK RESULTS:")
-    print("=" * 50)
-    print(result["fact_check_result"])
-    print("=" * 50)
+    print_result(result)
 
 
 if __name__ == "__main__":
@@ -1,27 +1,157 @@
-# research.py - 5-Node Research Pipeline using LangGraph
+# research.py - 4-Node Research Pipeline using LangGraph
 
+import hashlib
+import json
 import os
-from typing import TypedDict, Annotated
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage, AIMessage
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import AsyncIterator, TypedDict
+import httpx
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from langchain_core.messages import BaseMessage
+from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.tools import tool
-from tavily import TavilyClient
-from langgraph.graph import StateGraph, END
-import operator
+from openai import OpenAI
+from pydantic import BaseModel, Field
+from langgraph.graph import StateGraph, START, END
+
+from cache import SemanticLLMCache, SingleFlight, InMemoryBackend, RedisBackend, make_key
 
 
 # Define the state structure
 class ResearchState(TypedDict):
     """State for the research workflow"""
     topic: str
-    messages: Annotated[list[BaseMessage], operator.add]
     search_queries: list[str]  # Planned search queries from query_planner
-    search_results: str  # Raw search results from researcher
+    speculative_results: str  # Results of searching the raw topic, cleared once consumed
     extracted_facts: list[str]  # Facts extracted from research
     article: str  # Generated article
     fact_check_result: str  # Result from fact checker
 
 
+_TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+_TAVILY_MAX_RESULTS = 3
+# Page content beyond this is cut before it reaches the LLM; the lead carries most facts
+_MAX_CONTENT_CHARS = 500
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
+
+@lru_cache(maxsize=1)
+def _http_client() -> httpx.Client:
+    """
+    Shared HTTP/2 connection pool for every OpenAI and Tavily call.
+
+    Keeping connections alive across requests means a pipeline run
+    multiplexes its LLM and search calls over a couple of warm connections
+    instead of paying a TLS handshake per call.
+    """
+    return httpx.Client(
+        http2=True,
+        timeout=30,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+    )
+
+
+def close_http_client():
+    """Close the shared connection pool; call once on application shutdown."""
+    if _http_client.cache_info().currsize:
+        _http_client().close()
+
+
+# Model per node role: the mechanical steps (query planning, fact checking) run on a
+# smaller, cheaper model; only writing uses the higher-quality one. The mechanical
+# model can be served by any OpenAI-compatible endpoint, e.g. Together AI's
+# FAST_LLM_MODEL=meta-llama/Meta-Llama-3.1-8B-Instruct-Turbo with FAST_LLM_BASE_URL
+# and FAST_LLM_API_KEY.
+_MECHANICAL_MODEL = os.getenv("FAST_LLM_MODEL", "gpt-4.1-nano")
+_WRITER_MODEL = "gpt-4o-mini"
+
+
+# LLM clients are created lazily (they need OPENAI_API_KEY) and reused across requests
+@lru_cache(maxsize=1)
+def _llm_mechanical() -> ChatOpenAI:
+    """Shared temperature=0 LLM for query planning and fact checking."""
+    return ChatOpenAI(
+        model=_MECHANICAL_MODEL,
+        temperature=0,
+        base_url=os.getenv("FAST_LLM_BASE_URL"),
+        api_key=os.getenv("FAST_LLM_API_KEY") or os.getenv("OPENAI_API_KEY"),
+        http_client=_http_client()
+    )
+
+
+@lru_cache(maxsize=1)
+def _llm_writer() -> ChatOpenAI:
+    """Shared temperature=0.7 LLM for extracting facts and writing."""
+    return ChatOpenAI(model=_WRITER_MODEL, temperature=0.7, http_client=_http_client())
+
+
+@lru_cache(maxsize=1)
+def _response_cache() -> SemanticLLMCache:
+    """Shared cache for deterministic LLM calls and web searches (Redis if REDIS_URL is set)."""
+    redis_url = os.getenv("REDIS_URL")
+    backend = RedisBackend(redis_url) if redis_url else InMemoryBackend()
+    embeddings = OpenAIEmbeddings(model="text-embedding-3-small", http_client=_http_client())
+    return SemanticLLMCache(backend, embeddings.embed_query)
+
+
+# Identical LLM/search calls from concurrent requests share one upstream call
+_INFLIGHT = SingleFlight()
+
+
+def _request_payload(llm: ChatOpenAI, messages: list[BaseMessage]) -> dict:
+    """Everything that determines an LLM response, used for cache and in-flight keys."""
+    return {
+        "model": llm.model_name,
+        "temperature": llm.temperature,
+        "messages": [[m.type, m.content] for m in messages],
+    }
+
+
+def _cached_llm_call(
+    node: str,
+    llm: ChatOpenAI,
+    messages: list[BaseMessage],
+    similarity_text: str | None = None,
+    schema: type[BaseModel] | None = None,
+) -> str:
+    """
+    Invoke the LLM through the response cache and return the response content.
+
+    Only temperature=0 calls are cached. Near-duplicate requests share a
+    response only when similarity_text (the variable part of the prompt,
+    e.g. the topic) is given; otherwise just exact repeats hit the cache.
+    Concurrent identical calls are always coalesced into one.
+    With a schema, the LLM is asked for structured output and the content
+    is the parsed object serialized as JSON.
+    """
+    payload = _request_payload(llm, messages)
+
+    if schema is not None:
+        payload["schema"] = schema.__name__
+
+    def invoke() -> str:
+        if schema is None:
+            return llm.invoke(messages).content
+        return llm.with_structured_output(schema).invoke(messages).model_dump_json()
+
+    def call() -> str:
+        return _INFLIGHT.run(make_key(node, payload), invoke)
+
+    if llm.temperature != 0:
+        return call()
+
+    return _response_cache().cached(
+        node,
+        payload,
+        similarity_text or "",
+        call,
+        semantic=similarity_text is not None,
+    )
+
+
 # Define Tavily search as a tool
 @tool
 def tavily_search(query: str) -> str:
@@ -33,195 +163,215 @@ def tavily_search(query: str) -> str:
     Returns:
         Formatted search results
     """
-    client = TavilyClient(api_key=os.getenv("TAVILY_API_KEY"))
-    results = client.search(query=query, max_results=3)
+    payload = {"query": query, "max_results": _TAVILY_MAX_RESULTS, "max_content_chars": _MAX_CONTENT_CHARS}
+    return _response_cache().cached(
+        "tavily_search",
+        payload,
+        query,
+        lambda: _INFLIGHT.run(make_key("tavily_search", payload), lambda: _search_tavily(query))
+    )
+
 
-    # Format results for the LLM
+def _search_tavily(query: str) -> str:
+    """Run an uncached Tavily search and format the results for the LLM."""
+    response = _http_client().post(
+        _TAVILY_SEARCH_URL,
+        headers={"Authorization": f"Bearer {os.getenv('TAVILY_API_KEY')}"},
+        json={"query": query, "max_results": _TAVILY_MAX_RESULTS}
+    )
+    response.raise_for_status()
+    results = response.json()
+
+    # Format results for the LLM: truncated content, no URLs, mirrored pages skipped
     formatted_results = []
+    fingerprints = set()
     for result in results.get("results", []):
+        content = result.get("content", "N/A")[:_MAX_CONTENT_CHARS]
+        fingerprint = hashlib.sha1(content[:200].encode()).hexdigest()
+        if fingerprint in fingerprints:
+            continue
+        fingerprints.add(fingerprint)
         formatted_results.append(
             f"Title: {result.get('title', 'N/A')}\n"
-            f"URL: {result.get('url', 'N/A')}\n"
-            f"Content: {result.get('content', 'N/A')}\n"
+            f"Content: {content}\n"
         )
 
     return "\n---\n".join(formatted_results)
 
 
+def _dedupe_sentences(search_results: str) -> str:
+    """Drop content sentences already seen earlier in the combined search results."""
+    seen = set()
+    lines = []
+    for line in search_results.splitlines():
+        if line.startswith("Content: "):
+            sentences = [s for s in _SENTENCE_BOUNDARY.split(line[len("Content: "):]) if s not in seen]
+            seen.update(sentences)
+            if not sentences:
+                continue
+            line = "Content: " + " ".join(sentences)
+        lines.append(line)
+    return "\n".join(lines)
+
+
 # ============================================================================
 # NODE 1: Query Planner
 # ============================================================================
+_PLANNER_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", "You are a research strategist. Generate 2 focused search queries."),
+    ("human", """Topic: {topic}
+
+Generate exactly 2 specific search queries to research this topic.
+Focus on recent developments and technical details."""),
+])
+
+
+class QueryList(BaseModel):
+    """Structured output of the query_planner node's LLM call"""
+    queries: list[str] = Field(description="Specific search queries, without numbering or bullets")
+
+
 def query_planner(state: ResearchState) -> ResearchState:
     """
     Analyzes the topic and generates strategic search queries.
     This node plans what information to search for.
     """
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    messages = _PLANNER_PROMPT.format_messages(topic=state["topic"])
 
-    system_msg = SystemMessage(
-        content="You are a research strategist. Generate 2 focused search queries."
+    # Paraphrased topics plan the same queries, so allow similarity hits
+    content = _cached_llm_call(
+        "query_planner", _llm_mechanical(), messages, similarity_text=state["topic"], schema=QueryList
     )
 
-    human_msg = HumanMessage(
-        content=f"""Topic: {state['topic']}
+    # Partial update only: speculative_search writes to state in the same step
+    return {"search_queries": QueryList.model_validate_json(content).queries}
 
-Generate exactly 2 specific search queries to research this topic.
-Focus on recent developments and technical details.
 
-Return ONLY the queries, one per line, no numbering or bullets."""
-    )
+def _run_search(query: str) -> str:
+    """Run a single search, formatting errors inline instead of raising."""
+    try:
+        result = tavily_search.invoke(query)
+        return f"=== Search: {query} ===\n{result}"
+    except Exception as e:
+        return f"=== Search: {query} ===\nError: {str(e)}"
 
-    response = llm.invoke([system_msg, human_msg])
 
-    # Parse queries from response
-    queries = [q.strip() for q in response.content.strip().split('\n') if q.strip()]
+def _remaining_queries(topic: str, queries: list[str]) -> list[str]:
+    """Planned queries (limited to 2 for speed) not already covered by searching the topic."""
+    topic = topic.lower()
+    return [q for q in queries[:2] if q.lower() not in topic]
 
-    return {
-        **state,
-        "search_queries": queries,
-        "messages": [system_msg, human_msg, response]
-    }
+
+# ============================================================================
+# NODE 2: Speculative Search (runs in parallel with query_planner)
+# ============================================================================
+def speculative_search(state: ResearchState) -> ResearchState:
+    """
+    Searches the raw topic while query_planner is still running.
+    This hides the planning latency behind web I/O.
+    """
+    return {"speculative_results": _run_search(state["topic"])}
 
 
 # ============================================================================
-# NODE 2: Researcher (Direct Search - No Tool Loop)
+# NODE 3: Research and Write
 # ============================================================================
-def researcher(state: ResearchState) -> ResearchState:
+def _research(state: ResearchState) -> str:
     """
     Executes the planned search queries directly using Tavily.
     Simplified approach - no tool calling loop, just direct searches.
+    The queries are independent, so they run concurrently.
+    Queries already covered by the speculative topic search are skipped.
     """
-    # Get queries (limit to 2 for speed)
-    queries = state.get("search_queries", [])[:2]
+    speculative_results = state.get("speculative_results", "")
 
-    # Execute searches directly
+    # Get queries, dropping ones the topic search covered
+    queries = state.get("search_queries", [])
+    queries = _remaining_queries(state["topic"], queries) if speculative_results else queries[:2]
+
+    # Execute searches in parallel; map() keeps results in query order
     all_results = []
-    for query in queries:
-        try:
-            result = tavily_search.invoke(query)
-            all_results.append(f"=== Search: {query} ===\n{result}")
-        except Exception as e:
-            all_results.append(f"=== Search: {query} ===\nError: {str(e)}")
+    if queries:
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            all_results = list(executor.map(_run_search, queries))
 
-    search_results = "\n\n".join(all_results)
+    if speculative_results:
+        all_results.insert(0, speculative_results)
 
-    # Create message for trace visibility
-    research_msg = AIMessage(content=f"Completed {len(queries)} searches.\n\n{search_results}")
+    # Overlapping queries return overlapping pages; send each sentence once
+    return _dedupe_sentences("\n\n".join(all_results))
 
-    return {
-        **state,
-        "search_results": search_results,
-        "messages": [research_msg]
-    }
 
+class ExtractAndWriteSchema(BaseModel):
+    """Structured output of the research_and_write node's LLM call"""
+    facts: list[str] = Field(description="5-8 key facts explicitly stated in the search results")
+    article: str = Field(description="3-paragraph article written using only the extracted facts")
 
-# ============================================================================
-# NODE 3: Fact Extractor
-# ============================================================================
-def fact_extractor(state: ResearchState) -> ResearchState:
-    """
-    Extracts key facts from the search results as a structured list.
-    This creates a clean fact base that the writer must use.
-    """
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
-
-    # Use the search_results directly
-    research_content = state.get("search_results", "")
 
-    system_msg = SystemMessage(
-        content="You are a fact extraction specialist. Extract only verifiable facts from research. "
-                "Do not add any interpretation or information not explicitly stated in the research."
-    )
+_EXTRACT_AND_WRITE_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", "You are a fact extraction specialist and professional tech writer. "
+               "First extract only verifiable facts from research, then write engaging "
+               "articles based on those facts."),
+    ("human", """Topic: {topic}
 
-    human_msg = HumanMessage(
-        content=f"""From the search results below, extract key facts as a numbered list.
+Search Results:
+{search_results}
 
+STEP 1 - Extract 5-8 key facts from the search results.
 RULES:
 - Only include facts explicitly stated in the search results
 - Each fact should be a single, specific claim
 - Do NOT add any information not in the search results
 
-Search Results:
-{research_content}
-
-Extract 5-8 key facts:"""
-    )
-
-    response = llm.invoke([system_msg, human_msg])
-
-    # Parse facts from response
-    facts = [line.strip() for line in response.content.strip().split('\n') if line.strip()]
-
-    return {
-        **state,
-        "extracted_facts": facts,
-        "messages": [system_msg, human_msg, response]
-    }
+STEP 2 - Write a 3-paragraph article about {topic} using ONLY those facts.
+Requirements:
+- Start with an engaging hook
+- Explain key developments clearly
+- End with future implications
+- Target audience: Technical professionals"""),
+])
 
 
-# ============================================================================
-# NODE 4: Writer
-# ============================================================================
-def writer(state: ResearchState) -> ResearchState:
+def research_and_write(state: ResearchState) -> ResearchState:
     """
-    Writes an article using ONLY the extracted facts.
-    This is intentionally weak to demonstrate hallucination issues.
+    Runs the planned searches, then extracts key facts from the results and
+    writes an article from them in a single LLM call.
+    Search results are consumed here and never stored in state.
+    The writing half is intentionally weak to demonstrate hallucination issues.
     """
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.7)
-
-    facts_text = "\n".join(state.get("extracted_facts", []))
+    llm = _llm_writer()
+    structured_llm = llm.with_structured_output(ExtractAndWriteSchema)
 
-    system_msg = SystemMessage(
-        content="You are a professional tech writer. Write engaging articles based on the facts provided."
+    # Use the search results directly
+    messages = _EXTRACT_AND_WRITE_PROMPT.format_messages(
+        topic=state["topic"], search_results=_research(state)
     )
 
-    human_msg = HumanMessage(
-        content=f"""Write a 3-paragraph article about {state['topic']}.
-
-Available facts:
-{facts_text}
-
-Requirements:
-- Start with an engaging hook
-- Explain key developments clearly
-- End with future implications
-- Target audience: Technical professionals
-
-Write the article:"""
+    # Not cached (temperature > 0), but concurrent duplicates share one call
+    response = _INFLIGHT.run(
+        make_key("research_and_write", _request_payload(llm, messages)),
+        lambda: structured_llm.invoke(messages)
     )
 
-    response = llm.invoke([system_msg, human_msg])
-
+    # Clear the consumed search inputs so they are not carried to fact_checker
     return {
-        **state,
-        "article": response.content,
-        "messages": [system_msg, human_msg, response]
+        "search_queries": [],
+        "speculative_results": "",
+        "extracted_facts": response.facts,
+        "article": response.article
     }
 
 
 # ============================================================================
-# NODE 5: Fact Checker
+# NODE 4: Fact Checker
 # ============================================================================
-def fact_checker(state: ResearchState) -> ResearchState:
-    """
-    Verifies that claims in the article match the extracted facts.
-    Identifies any hallucinated content not supported by research.
-    """
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
-
-    facts_text = "\n".join(state.get("extracted_facts", []))
-    article = state.get("article", "")
-
-    system_msg = SystemMessage(
-        content="You are a fact-checking specialist. Compare articles against source facts "
-                "and identify any claims not supported by the evidence."
-    )
-
-    human_msg = HumanMessage(
-        content=f"""Compare the article against the verified facts and identify any issues.
+_FACT_CHECKER_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", "You are a fact-checking specialist. Compare articles against source facts "
+               "and identify any claims not supported by the evidence."),
+    ("human", """Compare the article against the verified facts and identify any issues.
 
 VERIFIED FACTS:
-{facts_text}
+{facts}
 
 ARTICLE TO CHECK:
 {article}
@@ -231,45 +381,54 @@ For each claim in the article, determine if it is:
 - UNSUPPORTED: Not found in the facts (potential hallucination)
 - EXAGGERATED: Overstates what the facts say
 
-Provide your analysis:"""
-    )
+Provide your analysis:"""),
+])
 
-    response = llm.invoke([system_msg, human_msg])
 
-    return {
-        **state,
-        "fact_check_result": response.content,
-        "messages": [system_msg, human_msg, response]
-    }
+def _fact_checker_messages(facts: list[str], article: str) -> list[BaseMessage]:
+    """Fill the fact_checker prompt."""
+    return _FACT_CHECKER_PROMPT.format_messages(facts="\n".join(facts), article=article)
+
+
+def fact_checker(state: ResearchState) -> ResearchState:
+    """
+    Verifies that claims in the article match the extracted facts.
+    Identifies any hallucinated content not supported by research.
+    """
+    messages = _fact_checker_messages(state.get("extracted_facts", []), state.get("article", ""))
+
+    # Each article is unique, so only exact repeats may reuse a result
+    content = _cached_llm_call("fact_checker", _llm_mechanical(), messages)
+
+    return {"fact_check_result": content}
 
 
 def create_research_workflow():
     """
-    Create and compile the 5-node LangGraph research workflow.
+    Create and compile the 4-node LangGraph research workflow.
 
-    Pipeline (linear flow):
+    Pipeline:
     1. query_planner → Plan search strategy
-    2. researcher → Execute searches directly
-    3. fact_extractor → Extract verified facts
-    4. writer → Generate article from facts
-    5. fact_checker → Verify article against facts
+    2. speculative_search → Search the raw topic (in parallel with 1)
+    3. research_and_write → Execute planned searches, extract facts and write article (waits for 1 and 2)
+    4. fact_checker → Verify article against facts
     """
     # Create the graph
     workflow = StateGraph(ResearchState)
 
-    # Add all 5 nodes
+    # Add all 4 nodes
     workflow.add_node("query_planner", query_planner)
-    workflow.add_node("researcher", researcher)
-    workflow.add_node("fact_extractor", fact_extractor)
-    workflow.add_node("writer", writer)
+    workflow.add_node("speculative_search", speculative_search)
+    workflow.add_node("research_and_write", research_and_write)
     workflow.add_node("fact_checker", fact_checker)
 
-    # Define linear flow
-    workflow.set_entry_point("query_planner")
-    workflow.add_edge("query_planner", "researcher")
-    workflow.add_edge("researcher", "fact_extractor")
-    workflow.add_edge("fact_extractor", "writer")
-    workflow.add_edge("writer", "fact_checker")
+    # Fan out from the start, fan back in at research_and_write
+    workflow.add_edge(START, "query_planner")
+    workflow.add_edge(START, "speculative_search")
+    workflow.add_edge(["query_planner", "speculative_search"], "research_and_write")
+
+    # Define linear flow for the rest
+    workflow.add_edge("research_and_write", "fact_checker")
     workflow.add_edge("fact_checker", END)
 
     # Compile the graph
@@ -278,38 +437,84 @@ def create_research_workflow():
     return app
 
 
-def run_research(topic: str) -> dict:
-    """
-    Run research on a given topic using the 5-node LangGraph pipeline.
+# Compiled graph is stateless between runs, so build it once per process
+_APP = None
 
-    Args:
-        topic: The topic to research and write about
 
-    Returns:
-        dict: Full result including article, facts, and fact-check results
-    """
-    # Validate required API keys
+def _get_app():
+    """Return the compiled research workflow, compiling it on first use."""
+    global _APP
+    if _APP is None:
+        _APP = create_research_workflow()
+    return _APP
+
+
+def _validate_api_keys():
+    """Raise ValueError if a required API key is missing."""
     if not os.getenv("OPENAI_API_KEY"):
         raise ValueError("OPENAI_API_KEY environment variable is not set")
     if not os.getenv("TAVILY_API_KEY"):
         raise ValueError("TAVILY_API_KEY environment variable is not set")
 
-    # Create workflow
-    app = create_research_workflow()
 
-    # Initialize state with all required fields
-    initial_state = {
+def _initial_state(topic: str) -> ResearchState:
+    """Initialize state with all required fields."""
+    return {
         "topic": topic,
-        "messages": [],
         "search_queries": [],
-        "search_results": "",
+        "speculative_results": "",
         "extracted_facts": [],
         "article": "",
         "fact_check_result": ""
     }
 
-    # Run the workflow
-    result = app.invoke(initial_state)
+
+def _compiled_pipeline(topic: str) -> dict:
+    """
+    Run the 4 nodes as plain function calls, bypassing the LangGraph runtime.
+
+    The graph is static with no conditional edges, so its schedule is fixed:
+    query_planner and speculative_search in parallel, then research_and_write,
+    then fact_checker. Running that schedule directly skips per-step channel
+    bookkeeping, at the cost of no graph-level tracing.
+    """
+    state = _initial_state(topic)
+
+    # Step 1: the two independent nodes, concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        plan = executor.submit(query_planner, state)
+        speculative = executor.submit(speculative_search, state)
+        state.update(plan.result())
+        state.update(speculative.result())
+
+    # Steps 2 and 3: linear
+    state.update(research_and_write(state))
+    state.update(fact_checker(state))
+
+    return state
+
+
+def run_research(topic: str) -> dict:
+    """
+    Run research on a given topic using the 4-node LangGraph pipeline.
+
+    Set FAST_PATH to run the nodes directly instead of through the compiled
+    graph (see _compiled_pipeline).
+
+    Args:
+        topic: The topic to research and write about
+
+    Returns:
+        dict: Full result including article, facts, and fact-check results
+    """
+    # Validate required API keys
+    _validate_api_keys()
+
+    if os.getenv("FAST_PATH"):
+        result = _compiled_pipeline(topic)
+    else:
+        # Run the workflow, reusing the compiled graph
+        result = _get_app().invoke(_initial_state(topic))
 
     return {
         "article": result["article"],
@@ -317,8 +522,209 @@ def run_research(topic: str) -> dict:
     }
 
 
+_NODES = {"query_planner", "speculative_search", "research_and_write", "fact_checker"}
+# The only node whose LLM output is prose; the others use structured output, which
+# streams raw JSON or tool-call chunks depending on the with_structured_output method
+_TOKEN_NODE = "fact_checker"
+
+
+def stream_research(topic: str) -> AsyncIterator[dict]:
+    """
+    Run research on a topic, yielding progress events as the pipeline runs.
+
+    API keys are validated immediately (raising ValueError), before the
+    returned iterator is consumed.
+
+    Event shapes:
+        {"type": "node_start", "node": ...}            a node began running
+        {"type": "token", "node": ..., "token": ...}    a streamed fact_checker LLM token
+        {"type": "article", "node": ..., "article": ...} the article is written
+        {"type": "result", "article": ..., "fact_check_result": ...} final output
+
+    Args:
+        topic: The topic to research and write about
+
+    Returns:
+        AsyncIterator[dict]: The pipeline's progress events
+    """
+    _validate_api_keys()
+    return _stream_events(topic)
+
+
+async def _stream_events(topic: str) -> AsyncIterator[dict]:
+    app = _get_app()
+
+    async for event in app.astream_events(_initial_state(topic), version="v2"):
+        kind = event["event"]
+        node = event.get("metadata", {}).get("langgraph_node")
+
+        if kind == "on_chat_model_stream":
+            token = event["data"]["chunk"].content
+            if node == _TOKEN_NODE and token and isinstance(token, str):
+                yield {"type": "token", "node": node, "token": token}
+        elif kind == "on_chain_start" and event["name"] in _NODES and event["name"] == node:
+            yield {"type": "node_start", "node": node}
+        elif kind == "on_chain_end" and event["name"] == "research_and_write" == node:
+            yield {"type": "article", "node": node, "article": event["data"]["output"]["article"]}
+        elif kind == "on_chain_end" and not event.get("parent_ids"):
+            output = event["data"]["output"]
+            yield {
+                "type": "result",
+                "article": output["article"],
+                "fact_check_result": output["fact_check_result"]
+            }
+
+
+# ============================================================================
+# Offline batch mode (OpenAI Batch API)
+# ============================================================================
+_BATCH_POLL_SECONDS = 30
+_BATCH_SEARCH_WORKERS = 8
+_OPENAI_ROLES = {"system": "system", "human": "user", "ai": "assistant"}
+
+
+@lru_cache(maxsize=1)
+def _openai_client() -> OpenAI:
+    """Shared raw OpenAI client for Batch API calls."""
+    return OpenAI(http_client=_http_client())
+
+
+def _chat_request(llm: ChatOpenAI, messages: list[BaseMessage], **extra) -> dict:
+    """Chat completion request body matching what the LLM would send itself."""
+    return {
+        "model": llm.model_name,
+        "temperature": llm.temperature,
+        "messages": [{"role": _OPENAI_ROLES[m.type], "content": m.content} for m in messages],
+        **extra,
+    }
+
+
+def _json_schema_format(schema: type[BaseModel]) -> dict:
+    """response_format asking the model for JSON matching a pydantic schema."""
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": schema.__name__, "schema": schema.model_json_schema()}
+    }
+
+
+def _run_openai_batch(requests: dict[str, dict]) -> dict[str, str]:
+    """
+    Submit chat completion requests as a single OpenAI batch and wait for it.
+
+    Args:
+        requests: Request bodies keyed by custom_id
+
+    Returns:
+        dict: Response content keyed by custom_id
+    """
+    client = _openai_client()
+
+    lines = [
+        json.dumps({"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": body})
+        for custom_id, body in requests.items()
+    ]
+    input_file = client.files.create(
+        file=("research_batch.jsonl", "\n".join(lines).encode()),
+        purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        time.sleep(_BATCH_POLL_SECONDS)
+        batch = client.batches.retrieve(batch.id)
+
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"OpenAI batch {batch.id} finished with status '{batch.status}'")
+
+    results = {}
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if response.get("status_code") == 200:
+            results[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+
+    missing = [custom_id for custom_id in requests if custom_id not in results]
+    if missing:
+        raise RuntimeError(f"OpenAI batch {batch.id} failed for requests: {', '.join(missing)}")
+
+    return results
+
+
+def run_research_batch(topics: list[str]) -> list[dict]:
+    """
+    Run research on many topics at once through the OpenAI Batch API.
+
+    Each LLM stage is submitted for all topics as one batch, which halves
+    the LLM cost but can take up to 24 hours. Use run_research for
+    interactive requests.
+
+    Args:
+        topics: The topics to research and write about
+
+    Returns:
+        list[dict]: One result per topic, in order, shaped like run_research's
+    """
+    _validate_api_keys()
+    if os.getenv("FAST_LLM_BASE_URL"):
+        raise ValueError("Batch mode only supports OpenAI-hosted models; unset FAST_LLM_BASE_URL")
+
+    mechanical_llm = _llm_mechanical()
+    writer_llm = _llm_writer()
+
+    # Stage 1: plan search queries for every topic
+    plans = _run_openai_batch({
+        f"plan-{i}": _chat_request(
+            mechanical_llm,
+            _PLANNER_PROMPT.format_messages(topic=topic),
+            response_format=_json_schema_format(QueryList)
+        )
+        for i, topic in enumerate(topics)
+    })
+
+    # Stage 2: search the topic plus its remaining planned queries, all topics concurrently
+    topic_queries = [
+        [topic] + _remaining_queries(topic, QueryList.model_validate_json(plans[f"plan-{i}"]).queries)
+        for i, topic in enumerate(topics)
+    ]
+    with ThreadPoolExecutor(max_workers=_BATCH_SEARCH_WORKERS) as executor:
+        search_outputs = iter(executor.map(_run_search, [q for queries in topic_queries for q in queries]))
+        search_results = [
+            _dedupe_sentences("\n\n".join(next(search_outputs) for _ in queries))
+            for queries in topic_queries
+        ]
+
+    # Stage 3: extract facts and write articles
+    drafts = _run_openai_batch({
+        f"write-{i}": _chat_request(
+            writer_llm,
+            _EXTRACT_AND_WRITE_PROMPT.format_messages(topic=topic, search_results=search_results[i]),
+            response_format=_json_schema_format(ExtractAndWriteSchema)
+        )
+        for i, topic in enumerate(topics)
+    })
+    drafts = [ExtractAndWriteSchema.model_validate_json(drafts[f"write-{i}"]) for i in range(len(topics))]
+
+    # Stage 4: fact check every article
+    checks = _run_openai_batch({
+        f"check-{i}": _chat_request(mechanical_llm, _fact_checker_messages(draft.facts, draft.article))
+        for i, draft in enumerate(drafts)
+    })
+
+    return [
+        {
+            "article": draft.article,
+            "fact_check_result": checks[f"check-{i}"]
+        }
+        for i, draft in enumerate(drafts)
+    ]
+
+
 if __name__ == "__main__":
-    # Example usage with 5-node pipeline
+    # Example usage with 4-node pipeline
     topic = "artificial intelligence in healthcare"
     result = run_research(topic)
     print("Article:", result["article"])
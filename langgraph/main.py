@@ -1,29 +1,61 @@
 #!/usr/bin/env python3
 # main.py - CLI entry point for LangGraph research
 
-from research import run_research
+import asyncio
+
+from research import run_research_batch, stream_research
+
+
+async def print_article(topic: str):
+    # Print the article as it is written
+    async for chunk in stream_research(topic):
+        print(chunk, end="", flush=True)
+    print()
+
+
+def print_batch(topics: list[str]):
+    # Research all topics concurrently, then print the articles in order
+    articles = asyncio.run(run_research_batch(topics))
+
+    for topic, article in zip(topics, articles):
+        print("=" * 50)
+        print(f"Generated Article: {topic}")
+        print("=" * 50)
+        print(article)
+    print("=" * 50)
 
 
 def main():
     print("=== LangGraph Research Demo ===\n")
 
-    # Get topic from user
-    topic = input("Enter a topic to research: ").strip()
+    # Get topic(s) from user
+    topics = [
+        topic.strip()
+        for topic in input("Enter a topic to research (comma-separate several): ").split(",")
+        if topic.strip()
+    ]
 
-    if not topic:
+    if not topics:
         print("Error: Topic cannot be empty")
         return
 
+    if len(topics) > 1:
+        print(f"\nResearching {len(topics)} topics: {', '.join(topics)}")
+        print("This may take a minute...\n")
+        print_batch(topics)
+        return
+
+    topic = topics[0]
     print(f"\nResearching: {topic}")
     print("This may take a minute...\n")
 
-    # Run research
-    article = run_research(topic)
-
-    print("\n" + "=" * 50)
+    print("=" * 50)
     print("Generated Article:")
     print("=" * 50)
-    print(article)
+
+    # Run research
+    asyncio.run(print_article(topic))
+
     print("=" * 50)
 
 
@@ -1,28 +1,60 @@
 # research.py - Research workflow using LangGraph
 
+import asyncio
+import hashlib
 import os
-from typing import TypedDict, Annotated, Literal
+import threading
+from concurrent.futures import Future
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+from functools import lru_cache
+from typing import AsyncIterator, TypedDict, Annotated, Literal
+import diskcache
+import httpx
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage, AIMessage
-from langchain_core.tools import tool
-from tavily import TavilyClient
+from langchain_core.messages import (
+    BaseMessage, HumanMessage, SystemMessage, AIMessage, AIMessageChunk, ToolCall, ToolMessage
+)
+from langchain_core.prompts import PromptTemplate
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import ToolException, tool
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 from langgraph.graph import StateGraph, END, MessagesState
-from langgraph.prebuilt import ToolNode
-import operator
+from langgraph.graph.message import add_messages
+from langgraph.types import Send
+from pydantic import ValidationError
+
+# Optional semantic cache of finished articles (pip install gptcache)
+try:
+    from gptcache.adapter.api import init_similar_cache, get as cache_get, put as cache_put
+except ImportError:
+    init_similar_cache = None
 
 
 # Define the state structure
 class ResearchState(TypedDict):
     """State for the research workflow"""
     topic: str
-    messages: Annotated[list[BaseMessage], operator.add]
-    research_complete: bool
+    messages: Annotated[list[BaseMessage], add_messages]
     article: str
 
 
+_TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+# Results per search; Tavily allows up to 20
+_TAVILY_MAX_RESULTS = int(os.getenv("TAVILY_MAX_RESULTS", "5"))
+
+# Searches repeat across runs on related topics, so results are kept on disk for a day
+_SEARCH_CACHE_TTL = 24 * 60 * 60
+
+
+@lru_cache(maxsize=1)
+def _search_cache() -> diskcache.Cache:
+    """On-disk cache of formatted search results, shared by all runs."""
+    return diskcache.Cache(".tavily_cache")
+
+
 # Define Tavily search as a tool
 @tool
-def tavily_search(query: str) -> str:
+async def tavily_search(query: str, config: RunnableConfig) -> str:
     """Search the web for information using Tavily.
 
     Args:
@@ -31,98 +63,307 @@ def tavily_search(query: str) -> str:
     Returns:
         Formatted search results
     """
-    client = TavilyClient(api_key=os.getenv("TAVILY_API_KEY"))
-    results = client.search(query=query, max_results=5)
+    return await _cached_search(query, config["configurable"]["http_client"])
 
-    # Format results for the LLM
-    formatted_results = []
-    for result in results.get("results", []):
-        formatted_results.append(
-            f"Title: {result.get('title', 'N/A')}\n"
-            f"URL: {result.get('url', 'N/A')}\n"
-            f"Content: {result.get('content', 'N/A')}\n"
-        )
 
-    return "\n---\n".join(formatted_results)
+async def _cached_search(query: str, http_client: httpx.AsyncClient) -> str:
+    """Search Tavily, reusing results from the on-disk cache when available."""
+    key = (query, _TAVILY_MAX_RESULTS)
+    cached = _search_cache().get(key)
+    if cached is not None:
+        return cached
 
+    results = await _search_tavily(query, http_client)
+    _search_cache().set(key, results, expire=_SEARCH_CACHE_TTL)
+    return results
 
-def research_agent(state: ResearchState) -> ResearchState:
-    """
-    Research agent that uses tools to gather information
-    """
-    # Initialize LLM with tools
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
-    tools = [tavily_search]
-    llm_with_tools = llm.bind_tools(tools)
 
-    # Create research prompt if not already in messages
-    if len(state["messages"]) == 0:
-        system_msg = SystemMessage(
-            content="You are a senior research analyst with expertise in uncovering the latest trends and data. "
-                    "Use the tavily_search tool to research the topic thoroughly."
-        )
-        human_msg = HumanMessage(
-            content=f"""Research the latest developments in {state['topic']}.
+async def _search_tavily(query: str, http_client: httpx.AsyncClient) -> str:
+    """Run an uncached Tavily search and format the results for the LLM."""
+    response = await http_client.post(
+        _TAVILY_SEARCH_URL,
+        headers={"Authorization": f"Bearer {os.getenv('TAVILY_API_KEY')}"},
+        json={"query": query, "max_results": _TAVILY_MAX_RESULTS}
+    )
+    response.raise_for_status()
+
+    # Format results for the LLM
+    return "\n---\n".join(
+        f"Title: {result.get('title', 'N/A')}\n"
+        f"URL: {result.get('url', 'N/A')}\n"
+        f"Content: {result.get('content', 'N/A')}\n"
+        for result in response.json().get("results", ())
+    )
+
+
+# Tools the research agent may call, by name
+_TOOLS = {search_tool.name: search_tool for search_tool in [tavily_search]}
+
+
+# LLM clients are built per run (see _checkpointed_runs), on the run's HTTP client
+def _llm_with_tools(http_client: httpx.AsyncClient):
+    """Temperature=0 research LLM with the search tool bound."""
+    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0, http_async_client=http_client)
+    return llm.bind_tools(list(_TOOLS.values()))
+
+
+def _llm_writer(http_client: httpx.AsyncClient) -> ChatOpenAI:
+    """Temperature=0.7 LLM for writing."""
+    return ChatOpenAI(model="gpt-4o-mini", temperature=0.7, http_async_client=http_client)
+
+
+# Static research instructions, identical for every topic. OpenAI caches prompt
+# prefixes of 1024+ tokens automatically, so this is kept long, fixed and first
+# in every call, with the topic only appearing in the message after it.
+_RESEARCH_SYSTEM_PROMPT = """You are a senior research analyst with expertise in uncovering the latest trends and data.
+Use the tavily_search tool to research the topic thoroughly.
+
+# Research methodology
+
+1. Scope the topic before searching. Identify the sub-areas a technical reader would expect
+   to be covered: the underlying technology, the organizations building it, the products or
+   research results that shipped recently, and the open problems that remain.
+2. Plan your searches up front. Issue several focused queries in a single turn rather than
+   one broad query at a time; independent searches run in parallel, so asking for them
+   together is faster. Good queries name a specific product, organization, technique,
+   benchmark or time frame. Avoid queries that merely restate the topic.
+3. Prefer recent, primary sources. Favor announcements, papers, release notes, documentation
+   and reputable technical press from the last six months over older coverage, opinion
+   pieces, listicles and aggregator pages. When a source is undated, treat its claims as
+   possibly stale.
+4. Cross-check important claims. A figure, date, ranking or capability claim that will
+   anchor the summary should be confirmed by a second independent source when possible.
+   If sources disagree, note the disagreement instead of picking one silently.
+5. Search again only when it adds something. Follow-up searches should fill a concrete gap
+   you have identified (a missing major player, an unexplained term, an unverified number),
+   not repeat earlier queries with different wording. Stop searching once the key
+   innovations, players and trends are covered; two or three rounds are usually enough.
+6. Stay within the evidence. Do not fill gaps from memory or speculation. If something
+   important could not be found, say so explicitly in the summary.
+
+# What to look for
+
+- Key innovations: new techniques, architectures, products, releases, standards or
+  research results, with what changed compared to what came before.
+- Major players: companies, research labs, open-source projects and notable individuals,
+  and what each contributed. Include funding, partnerships or acquisitions only when they
+  materially shape the field.
+- Emerging trends: directions that multiple independent sources point to, adoption
+  signals, regulation, and shifts in cost, performance or accessibility.
+- Concrete evidence: numbers (benchmarks, market sizes, adoption figures), dates and
+  named examples are more useful than general statements.
+- Limitations and risks: technical limitations, open research questions, safety, ethical
+  or regulatory concerns that a technical audience would want to know about.
+
+# Handling search results
+
+- Search results contain a title, URL and content excerpt per hit. Excerpts can be
+  truncated or out of context; do not over-interpret partial sentences.
+- Ignore results that are clearly irrelevant, promotional without substance, duplicated
+  across sites, or older than the topic's recent developments.
+- Distinguish between what a source reports as fact, what it quotes someone as claiming,
+  and what it predicts. Preserve that distinction in the summary.
+- When a search returns nothing useful, rephrase once with more specific terms, then move on.
+
+# Output format
+
+When your research is complete, reply without calling any tools, using exactly this structure:
+
+## Key innovations
+- One bullet per innovation: what it is, who is behind it, and when it appeared.
+
+## Major players
+- One bullet per organization or project and its specific contribution.
+
+## Emerging trends
+- One bullet per trend, with the evidence that supports it.
+
+## Open questions
+- Gaps in the available information, unresolved disagreements between sources, and
+  limitations or risks worth highlighting.
+
+Guidelines for the summary:
+- Write in concise, factual bullet points; each bullet should carry one specific claim.
+- Include concrete names, numbers and dates wherever the sources provide them.
+- Mention the source (publication or organization) for claims that are surprising,
+  quantitative or contested.
+- Do not include marketing language, speculation presented as fact, or claims that no
+  search result supports.
+- Aim for 10 to 20 bullets in total; completeness on the important points matters more
+  than length.
+
+# Quality checklist
+
+Before replying without tool calls, check that:
+- Every section has at least one bullet, or explicitly states that nothing relevant was found.
+- No bullet relies on a single promotional source for a significant claim.
+- Developments are described relative to what existed before, so their significance is clear.
+- Dates are specific (month and year) where the sources allow, and nothing older than
+  the last six months is presented as new.
+- Terminology is used precisely; acronyms are expanded the first time they appear.
+- The summary reads as neutral analysis, not as advocacy for any company or product.
+- Nothing in the summary contradicts the search results you received.
+
+This summary will be used by a writer to produce a short article for technical
+professionals, so prioritize the developments that are most significant, most recent
+and best supported by the evidence."""
+
+# Built once and shared by every run; the fixed id keeps add_messages from assigning one in place
+_RESEARCH_SYSTEM = SystemMessage(content=_RESEARCH_SYSTEM_PROMPT, id="research-system")
+
+_RESEARCH_HUMAN_TEMPLATE = PromptTemplate.from_template("""Research the latest developments in {topic}.
 
 Focus on:
 - Key innovations in the last 6 months
 - Major players and their contributions
 - Emerging trends
 
-Use the search tool to gather information, then provide a detailed bullet-point summary."""
-        )
-        messages = [system_msg, human_msg]
+Use the search tool to gather information, then provide a detailed bullet-point summary.""")
+
+_WRITING_TEMPLATE = PromptTemplate.from_template("""Now write a 3-paragraph article about {topic} that:
+- Starts with an engaging hook
+- Explains key developments clearly
+- Ends with future implications
+
+Target audience: Technical professionals.
+
+Use the research you gathered above to write the article.""")
+
+
+async def research_agent(state: ResearchState, config: RunnableConfig) -> ResearchState:
+    """
+    Research agent that uses tools to gather information
+    """
+    # Create research prompt if not already in messages, and keep it there so
+    # every later call starts with the same cacheable prefix
+    if len(state["messages"]) == 0:
+        new_messages = [
+            _RESEARCH_SYSTEM,
+            HumanMessage(content=_RESEARCH_HUMAN_TEMPLATE.format(topic=state["topic"]))
+        ]
+        messages = new_messages
     else:
+        new_messages = []
         messages = state["messages"]
 
     # Get response from LLM
-    response = llm_with_tools.invoke(messages)
+    response = await config["configurable"]["llm_with_tools"].ainvoke(messages)
 
     return {
-        **state,
-        "messages": [response]
+        "messages": new_messages + [response]
     }
 
 
 # Should we continue or finish research?
-def should_continue_research(state: ResearchState) -> Literal["tools", "write"]:
+def should_continue_research(state: ResearchState) -> list[Send] | Literal["write"]:
     """Determine if we should continue research or move to writing"""
     last_message = state["messages"][-1]
 
-    # If the LLM called tools, continue to tool execution
+    # If the LLM called tools, run each call as its own parallel tools task
     if hasattr(last_message, "tool_calls") and last_message.tool_calls:
-        return "tools"
+        return [Send("tools", {"tool_call": tool_call}) for tool_call in last_message.tool_calls]
 
     # Otherwise, move to writing
     return "write"
 
 
-def writing_node(state: ResearchState) -> ResearchState:
+class ToolCallState(TypedDict):
+    """Input of one fanned-out tools task"""
+    tool_call: ToolCall
+
+
+async def tool_node(state: ToolCallState, config: RunnableConfig) -> ResearchState:
     """
-    Writing node that creates an article based on research
+    Executes a single tool call from the research agent
+
+    Calls the model got wrong (unknown tool, invalid arguments) are answered
+    with an error ToolMessage so the model can correct them, as ToolNode
+    does; other failures (e.g. Tavily being down) still fail the run.
     """
-    # Initialize LLM
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.7)
+    tool_call = state["tool_call"]
+    selected_tool = _TOOLS.get(tool_call["name"])
+
+    if selected_tool is None:
+        result = ToolMessage(
+            content=f"Error: {tool_call['name']} is not a valid tool, try one of [{', '.join(_TOOLS)}].",
+            name=tool_call["name"],
+            tool_call_id=tool_call["id"],
+            status="error"
+        )
+    else:
+        try:
+            # Invoking a tool with a tool call returns a ToolMessage answering it; the
+            # run config carries the run's HTTP client
+            result = await selected_tool.ainvoke(tool_call, config)
+        except (ValidationError, ToolException) as e:
+            result = ToolMessage(
+                content=f"Error: {e!r}\n Please fix your mistakes.",
+                name=tool_call["name"],
+                tool_call_id=tool_call["id"],
+                status="error"
+            )
 
-    # Add writing instruction to the conversation
-    writing_msg = HumanMessage(
-        content=f"""Now write a 3-paragraph article about {state['topic']} that:
-- Starts with an engaging hook
-- Explains key developments clearly
-- Ends with future implications
+    # add_messages merges the messages of parallel tasks into the conversation
+    return {"messages": [result]}
 
-Target audience: Technical professionals.
 
-Use the research you gathered above to write the article."""
-    )
+# Characters of earlier search results kept verbatim in the conversation; older ones are compacted
+_TOOL_HISTORY_CHARS = 6000
+_COMPACTED_PREFIX = "[prior search"
+
+
+def compact_tools(state: ResearchState) -> ResearchState:
+    """
+    Shrinks old search results so the conversation re-sent on every research
+    call stays bounded.
+
+    Results from the latest round of tool calls are kept as is, since the
+    agent has not seen them yet. Earlier results are kept newest first
+    until _TOOL_HISTORY_CHARS is used up; the rest are replaced (by message
+    id) with a one-line note of the query.
+    """
+    messages = state["messages"]
+    queries = {
+        tool_call["id"]: tool_call["args"].get("query", "")
+        for message in messages if isinstance(message, AIMessage)
+        for tool_call in message.tool_calls
+    }
+    latest_request = max(i for i, message in enumerate(messages) if isinstance(message, AIMessage))
+
+    budget = _TOOL_HISTORY_CHARS
+    compacted = []
+    for message in reversed(messages[:latest_request]):
+        if not isinstance(message, ToolMessage) or message.content.startswith(_COMPACTED_PREFIX):
+            continue
+        if len(message.content) <= budget:
+            budget -= len(message.content)
+            continue
+
+        # Once over budget, everything older is compacted too
+        budget = 0
+        compacted.append(ToolMessage(
+            content=f"{_COMPACTED_PREFIX} '{queries.get(message.tool_call_id, '')}': {len(message.content)} chars]",
+            tool_call_id=message.tool_call_id,
+            id=message.id
+        ))
+
+    # add_messages replaces messages with matching ids
+    return {"messages": compacted}
+
+
+async def writing_node(state: ResearchState, config: RunnableConfig) -> ResearchState:
+    """
+    Writing node that creates an article based on research
+    """
+    # Add writing instruction to the conversation
+    writing_msg = HumanMessage(content=_WRITING_TEMPLATE.format(topic=state["topic"]))
 
     messages = state["messages"] + [writing_msg]
 
-    # Generate article
-    response = llm.invoke(messages)
+    # Generate article (token by token when the graph is run with stream_mode="messages")
+    response = await config["configurable"]["llm_writer"].ainvoke(messages)
 
     return {
-        **state,
         "article": response.content,
         "messages": [writing_msg, response]
     }
@@ -135,30 +376,25 @@ def create_research_workflow():
     # Create the graph
     workflow = StateGraph(ResearchState)
 
-    # Create tool node
-    tools = [tavily_search]
-    tool_node = ToolNode(tools)
-
     # Add nodes
     workflow.add_node("research_agent", research_agent)
     workflow.add_node("tools", tool_node)
+    workflow.add_node("compact_tools", compact_tools)
     workflow.add_node("write", writing_node)
 
     # Add edges
     workflow.set_entry_point("research_agent")
 
-    # Add conditional edge from research agent
+    # Add conditional edge from research agent (fans out to one tools task per call)
     workflow.add_conditional_edges(
         "research_agent",
         should_continue_research,
-        {
-            "tools": "tools",
-            "write": "write"
-        }
+        ["tools", "write"]
     )
 
-    # After tools, go back to research agent
-    workflow.add_edge("tools", "research_agent")
+    # After all tools tasks finish, compact old results and go back to research agent
+    workflow.add_edge("tools", "compact_tools")
+    workflow.add_edge("compact_tools", "research_agent")
 
     # After writing, end
     workflow.add_edge("write", END)
@@ -169,39 +405,347 @@ def create_research_workflow():
     return app
 
 
-def run_research(topic: str) -> str:
-    """
-    Run research on a given topic using LangGraph
+# The graph is static and holds no per-run state, so compile it once at import;
+# runs attach their own checkpointer to a copy (see _checkpointed_runs)
+_APP = create_research_workflow()
 
-    Args:
-        topic: The topic to research and write about
 
-    Returns:
-        str: The generated article
-    """
-    # Validate required API keys
+@lru_cache(maxsize=1)
+def _article_cache_enabled() -> bool:
+    """Initialize the GPTCache article cache on first use; False if gptcache isn't installed."""
+    if init_similar_cache is None:
+        return False
+    init_similar_cache(data_dir="research_cache")
+    return True
+
+
+def _validate_api_keys():
+    """Raise ValueError if a required API key is missing"""
     if not os.getenv("OPENAI_API_KEY"):
         raise ValueError("OPENAI_API_KEY environment variable is not set")
     if not os.getenv("TAVILY_API_KEY"):
         raise ValueError("TAVILY_API_KEY environment variable is not set")
 
-    # Create workflow
-    app = create_research_workflow()
 
-    # Initialize state
-    initial_state = {
+def _initial_state(topic: str) -> ResearchState:
+    """Initialize state with all required fields"""
+    return {
         "topic": topic,
         "messages": [],
-        "research_complete": False,
         "article": ""
     }
 
-    # Run the workflow
-    result = app.invoke(initial_state)
+
+# Per-topic checkpoints of unfinished runs, so a failed run can be resumed
+_CHECKPOINT_DB = "research_state.db"
+
+
+def _thread_id(topic: str) -> str:
+    """Checkpoint thread id for a topic"""
+    return hashlib.sha1(topic.encode()).hexdigest()
+
+
+class _ActiveRuns:
+    """
+    Workflow runs in progress in this process, by checkpoint thread id.
+
+    Concurrent runs of one topic would share its checkpoint thread: the
+    second would resume the first's unfinished thread and both would delete
+    it. Instead the first caller runs the topic and later callers wait for
+    its article. The futures are thread-safe, so callers on other event
+    loops (e.g. run_research from several threads) can wait on them too.
+
+    An owner that stops early (cancelled, or a stream that was abandoned)
+    cancels its future; the topic can then be claimed again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._runs: dict[str, Future] = {}
+
+    def claim(self, thread_id: str) -> tuple[Future, bool]:
+        """Return (future, owner): owner is True if the caller must run the topic itself."""
+        with self._lock:
+            future = self._runs.get(thread_id)
+            if future is not None and not future.cancelled():
+                return future, False
+            future = self._runs[thread_id] = Future()
+            return future, True
+
+    @contextmanager
+    def owned(self, thread_id: str, future: Future):
+        """Around the owner's run: fail the waiters if it raises, then release the topic."""
+        try:
+            yield
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            with self._lock:
+                # Unless a waiter already claimed the topic again after a cancellation
+                if self._runs.get(thread_id) is future:
+                    del self._runs[thread_id]
+
+
+_ACTIVE_RUNS = _ActiveRuns()
+
+
+async def _joined_article(future: Future) -> str | None:
+    """
+    Wait for the article of a run owned by another caller
+
+    Returns None if the owner stopped without finishing, so the caller can
+    claim the topic and run it itself rather than fail with a cancellation
+    it never asked for.
+    """
+    try:
+        # Shielded so a cancelled waiter doesn't cancel the owner's run
+        return await asyncio.shield(asyncio.wrap_future(future))
+    except asyncio.CancelledError:
+        if future.cancelled() and not asyncio.current_task().cancelling():
+            return None
+        raise
+
+
+@asynccontextmanager
+async def _checkpointed_runs(topics: list[str]):
+    """
+    Yield (app, inputs, configs) for running the workflow on each topic with
+    SQLite checkpointing.
+
+    Every completed step is saved under a thread derived from the topic. If
+    an earlier run of the same topic failed part way, its input is None so
+    the run resumes after its last completed step instead of starting over.
+    The checkpoints are deleted once the runs complete.
+
+    The configs also carry the clients the runs search and call the LLMs
+    through. Async connections belong to the event loop that opened them,
+    and run_research starts a fresh loop per call, so the clients are
+    opened here on one HTTP client that is closed with the runs, rather
+    than shared by the process.
+
+    Callers must own the topics in _ACTIVE_RUNS. That only guards against
+    concurrent runs within this process: two processes researching the same
+    topic at the same time still share, and can corrupt, its thread.
+    """
+    thread_ids = [_thread_id(topic) for topic in topics]
+
+    # The saver's connection belongs to the running event loop too, so it is opened per call
+    async with (
+        httpx.AsyncClient(timeout=30) as http_client,
+        AsyncSqliteSaver.from_conn_string(_CHECKPOINT_DB) as checkpointer
+    ):
+        clients = {
+            "http_client": http_client,
+            "llm_with_tools": _llm_with_tools(http_client),
+            "llm_writer": _llm_writer(http_client)
+        }
+        configs = [{"configurable": {"thread_id": thread_id, **clients}} for thread_id in thread_ids]
+        app = _APP.copy(update={"checkpointer": checkpointer})
+
+        run_inputs = []
+        for topic, thread_id, config in zip(topics, thread_ids, configs):
+            snapshot = await app.aget_state(config)
+            if snapshot.next:
+                run_inputs.append(None)
+            else:
+                # Nothing to resume; clear any leftovers so the run starts from a clean thread
+                await checkpointer.adelete_thread(thread_id)
+                run_inputs.append(_initial_state(topic))
+
+        # Not reached if a run raises, leaving the checkpoints for the retry
+        yield app, run_inputs, configs
+        for thread_id in thread_ids:
+            await checkpointer.adelete_thread(thread_id)
+
+
+async def _cached_article(topic: str) -> str | None:
+    """Cached article for a similar topic, if gptcache is installed and has one"""
+    # GPTCache is synchronous (embedding model + vector store), so keep it off the event loop
+    if not await asyncio.to_thread(_article_cache_enabled):
+        return None
+    return await asyncio.to_thread(cache_get, topic)
+
+
+async def _cache_article(topic: str, article: str):
+    """Store a finished article in the cache, if gptcache is installed"""
+    if await asyncio.to_thread(_article_cache_enabled):
+        await asyncio.to_thread(cache_put, topic, article)
+
+
+async def run_research_async(topic: str) -> str:
+    """
+    Run research on a given topic using LangGraph
+
+    The nodes await their LLM calls, so many topics can be researched
+    concurrently on one event loop, e.g. with asyncio.gather.
+
+    If gptcache is installed, articles are cached by topic similarity, so a
+    repeated or paraphrased topic returns the earlier article without
+    running the workflow.
+
+    Args:
+        topic: The topic to research and write about
+
+    Returns:
+        str: The generated article
+    """
+    _validate_api_keys()
+
+    hit = await _cached_article(topic)
+    if hit is not None:
+        return hit
+
+    # Join a run of the same topic that is already in flight, or run it if there is none
+    thread_id = _thread_id(topic)
+    while True:
+        future, owner = _ACTIVE_RUNS.claim(thread_id)
+        if owner:
+            break
+        article = await _joined_article(future)
+        if article is not None:
+            return article
+
+    with _ACTIVE_RUNS.owned(thread_id, future):
+        # Run the workflow
+        async with _checkpointed_runs([topic]) as (app, (run_input,), (config,)):
+            result = await app.ainvoke(run_input, config)
+
+        await _cache_article(topic, result["article"])
+        future.set_result(result["article"])
 
     return result["article"]
 
 
+async def stream_research(topic: str) -> AsyncIterator[str]:
+    """
+    Run research on a given topic, yielding the article as it is written
+
+    Research runs as usual; once the writing node starts, its tokens are
+    yielded as the LLM generates them. A cached article, or the article of
+    a run of the same topic already in flight, is yielded whole.
+
+    Args:
+        topic: The topic to research and write about
+
+    Returns:
+        AsyncIterator[str]: Chunks of the generated article, in order
+    """
+    _validate_api_keys()
+
+    hit = await _cached_article(topic)
+    if hit is not None:
+        yield hit
+        return
+
+    thread_id = _thread_id(topic)
+    while True:
+        future, owner = _ACTIVE_RUNS.claim(thread_id)
+        if owner:
+            break
+        article = await _joined_article(future)
+        if article is not None:
+            yield article
+            return
+
+    with _ACTIVE_RUNS.owned(thread_id, future):
+        # "messages" streams LLM tokens from inside the nodes, "values" the state after each step
+        result = None
+        async with _checkpointed_runs([topic]) as (app, (run_input,), (config,)):
+            async for mode, payload in app.astream(run_input, config, stream_mode=["messages", "values"]):
+                if mode == "values":
+                    result = payload
+                    continue
+
+                # Only LLM token chunks; "messages" also emits the messages nodes return
+                chunk, metadata = payload
+                if (
+                    metadata.get("langgraph_node") == "write"
+                    and isinstance(chunk, AIMessageChunk)
+                    and chunk.content
+                ):
+                    yield chunk.content
+
+        await _cache_article(topic, result["article"])
+        future.set_result(result["article"])
+
+
+async def run_research_batch(topics: list[str], max_concurrency: int = 8) -> list[str]:
+    """
+    Run research on many topics concurrently using LangGraph
+
+    Uncached topics run as one abatch call over the compiled graph, with up
+    to max_concurrency runs in flight at a time.
+
+    Args:
+        topics: The topics to research and write about
+        max_concurrency: Maximum number of workflow runs in flight
+
+    Returns:
+        list[str]: One generated article per topic, in order
+    """
+    _validate_api_keys()
+
+    # Each distinct topic runs once; repeats share its checkpoint thread and article
+    articles = {}
+    for topic in dict.fromkeys(topics):
+        hit = await _cached_article(topic)
+        if hit is not None:
+            articles[topic] = hit
+    pending = [topic for topic in dict.fromkeys(topics) if topic not in articles]
+
+    while pending:
+        # Topics already being researched by another caller are joined, not rerun
+        owned, joined = {}, {}
+        for topic in pending:
+            future, owner = _ACTIVE_RUNS.claim(_thread_id(topic))
+            (owned if owner else joined)[topic] = future
+
+        if owned:
+            with ExitStack() as stack:
+                for topic, future in owned.items():
+                    stack.enter_context(_ACTIVE_RUNS.owned(_thread_id(topic), future))
+
+                async with _checkpointed_runs(list(owned)) as (app, run_inputs, configs):
+                    results = await app.abatch(run_inputs, [
+                        {**config, "max_concurrency": max_concurrency} for config in configs
+                    ])
+
+                for (topic, future), result in zip(owned.items(), results):
+                    articles[topic] = result["article"]
+                    await _cache_article(topic, result["article"])
+                    future.set_result(result["article"])
+
+        # A joined run whose owner stopped early is run in the next round
+        pending = []
+        for topic, future in joined.items():
+            article = await _joined_article(future)
+            if article is None:
+                pending.append(topic)
+            else:
+                articles[topic] = article
+
+    return [articles[topic] for topic in topics]
+
+
+def run_research(topic: str) -> str:
+    """
+    Run research on a given topic using LangGraph (blocking wrapper around
+    run_research_async)
+
+    Args:
+        topic: The topic to research and write about
+
+    Returns:
+        str: The generated article
+    """
+    return asyncio.run(run_research_async(topic))
+
+
 if __name__ == "__main__":
     # Example usage
     topic = "artificial intelligence in healthcare"